@@ -57,10 +57,22 @@ Only one PDF file should be submitted — the code in the GitHub link must also
 Organize your work in an easy-to-read format. 
 """
 
+import logging
+import math
+import operator
+import sys
+from collections import Counter
 from datetime import datetime
-from typing import List, Optional, Dict, Tuple
+from itertools import chain, repeat
+from typing import Any, Callable, Iterable, List, Optional, Dict, Set, Tuple
+
+log = logging.getLogger(__name__)
+
+_POINTS_MAP: Dict[str, float] = {"A": 4.0, "B": 3.0, "C": 2.0, "D": 1.0, "E": 0.0, "F": 0.0}
 
 class Person:
+    __slots__ = ("person_id", "name", "email", "phone", "role")
+
     def __init__(self, person_id: str, name: str, email: str, phone: Optional[str] = None):
         self.person_id = person_id
         self.name = name
@@ -68,34 +80,47 @@ class Person:
         self.phone = phone
         self.role = None
 
+    def info_lines(self) -> List[str]:
+        return [f"ID: {self.person_id}, Name: {self.name}, Email: {self.email}, Phone: {self.phone}"]
+
     def display_info(self) -> None:
-        print(f"ID: {self.person_id}, Name: {self.name}, Email: {self.email}, Phone: {self.phone}")
+        print("\n".join(self.info_lines()))
 
     def update_contact(self, email: str, phone: Optional[str]) -> None:
         self.email = email
         self.phone = phone
-        print(f"{self.name}'s contact updated.")
+        log.info("%s's contact updated.", self.name)
 
 class Student(Person):
+    __slots__ = ("courses", "grades", "attendance", "last_login", "_code_to_course")
+
     def __init__(self, student_id: str, name: str, email: str, phone: Optional[str] = None):
         super().__init__(student_id, name, email, phone)
         self.role = "Student"
         self.courses: List['Course'] = []
-        self.grades: Dict[str, str] = {}           # course_code -> grade (A-F)
-        self.attendance: Dict[str, List[bool]] = {} # course_code -> list of attendance booleans
+        self.grades: Dict[str, str] = {}           # course_code -> grade (A-F, upper case)
+        self.attendance: Dict[str, Tuple[int, int]] = {} # course_code -> (presence bitmap, session count)
+        self.last_login: Optional[datetime] = None  # set by login(), not at construction
+        self._code_to_course: Dict[str, 'Course'] = {}  # course_code -> Course, kept in sync by _link
+
+    def login(self) -> None:
         self.last_login = datetime.now()
 
     def register_course(self, course: 'Course') -> bool:
         """
-        Add course to student's course list if not present.
+        Enroll this student in course, updating both sides of the link.
         Returns True if added, False if already present.
-        Note: This method does not modify course.students to avoid cyclic side effects;
-        use Course.enroll_student(course, student) or Registrar.enroll(...) for a full enrollment.
         """
-        if course.code in {c.code for c in self.courses}:
-            return False
-        self.courses.append(course)
-        return True
+        return _link(self, course)
+
+    def drop_course(self, course: 'Course') -> bool:
+        """
+        Remove this student from course, updating both sides of the link.
+        The grade and attendance recorded for the course are discarded, so a dropped
+        course no longer counts towards compute_gpa or average_attendance.
+        Returns True if removed, False if the student was not enrolled.
+        """
+        return _unlink(self, course)
 
     def compute_gpa(self) -> float:
         """
@@ -106,36 +131,43 @@ class Student(Person):
         """
         if not self.grades:
             return 0.0
-        points_map = {"A": 4.0, "B": 3.0, "C": 2.0, "D": 1.0, "E": 0.0, "F": 0.0}
-        total_weighted_points = 0.0
-        total_credits = 0.0
-        # Find credit hours by course code where possible
-        code_to_course = {c.code: c for c in self.courses}
-        for code, grade in self.grades.items():
-            pts = points_map.get(grade.upper(), 0.0)
-            credit = float(code_to_course.get(code, None).credit_hours) if code in code_to_course else 1.0
-            total_weighted_points += pts * credit
-            total_credits += credit
+        code_to_course = self._code_to_course
+        credits = [float(code_to_course[code].credit_hours) if code in code_to_course else 1.0
+                   for code in self.grades]
+        # Grade points are looked up and weighted via map() so the per-grade work stays in C;
+        # math.fsum sums with exact partials, avoiding drift from repeated +=
+        points = map(_POINTS_MAP.get, self.grades.values(), repeat(0.0))
+        total_weighted_points = math.fsum(map(operator.mul, points, credits))
+        total_credits = math.fsum(credits)
         if total_credits == 0:
             return 0.0
         return round(total_weighted_points / total_credits, 2)
 
+    def mark_attendance(self, course_code: str, present: bool) -> None:
+        """
+        Record one session of attendance for the given course.
+        """
+        bitmap, sessions = self.attendance.get(course_code, (0, 0))
+        self.attendance[course_code] = ((bitmap << 1) | int(bool(present)), sessions + 1)
+
     def average_attendance(self) -> float:
         """
         Returns average attendance percent across courses for which attendance exists.
+        Sessions attended per course are counted with int.bit_count on the presence bitmap.
         """
-        if not self.attendance:
-            return 0.0
-        total_pct = 0.0
-        count = 0
-        for records in self.attendance.values():
-            if not records:
-                continue
-            attended = sum(1 for r in records if r)
-            pct = (attended / len(records)) * 100
-            total_pct += pct
-            count += 1
-        return round(total_pct / count, 1) if count else 0.0
+        pcts = [bitmap.bit_count() / sessions for bitmap, sessions in self.attendance.values() if sessions]
+        return round(math.fsum(pcts) / len(pcts) * 100, 1) if pcts else 0.0
+
+    def _format_performance(self, gpa: float, avg_att: float) -> List[str]:
+        lines = [f"{self.name} -> GPA: {gpa}, Attendance: {avg_att:.1f}%"]
+        if gpa >= 3.5 and avg_att >= 90:
+            lines.append("Excellent performance!")
+        elif gpa < 2.0 or avg_att < 60:
+            lines.append("Warning: Poor performance")
+        return lines
+
+    def performance_lines(self) -> List[str]:
+        return self._format_performance(self.compute_gpa(), self.average_attendance())
 
     def report_performance(self) -> Tuple[float, float]:
         """
@@ -143,15 +175,13 @@ class Student(Person):
         """
         gpa = self.compute_gpa()
         avg_att = self.average_attendance()
-        print(f"{self.name} -> GPA: {gpa}, Attendance: {avg_att:.1f}%")
-        if gpa >= 3.5 and avg_att >= 90:
-            print("Excellent performance!")
-        elif gpa < 2.0 or avg_att < 60:
-            print("Warning: Poor performance")
+        print("\n".join(self._format_performance(gpa, avg_att)))
         return gpa, avg_att
 
 
 class Course:
+    __slots__ = ("code", "title", "credit_hours", "lecturer", "students", "_student_ids")
+
     def __init__(self, code: str, title: str, credit_hours: int, lecturer: Optional['Lecturer'] = None):
         if credit_hours <= 0:
             raise ValueError("credit_hours must be positive")
@@ -160,101 +190,238 @@ class Course:
         self.credit_hours = credit_hours
         self.lecturer = lecturer
         self.students: List[Student] = []
+        self._student_ids: Set[str] = set()        # mirrors self.students for O(1) membership
 
     def enroll_student(self, student: Student) -> bool:
         """
         Enroll student in course and ensure student.courses includes this course.
         Returns True if enrollment was performed, False if already enrolled.
         """
-        if any(s.person_id == student.person_id for s in self.students):
-            print(f"{student.name} already enrolled in {self.title}")
+        if not _link(student, self):
+            log.warning("%s already enrolled in %s", student.name, self.title)
             return False
-        self.students.append(student)
-        student.register_course(self)  # safe: register_course only adds to student's list if needed
-        print(f"{student.name} added to {self.title}")
+        log.debug("%s added to %s", student.name, self.title)
         return True
 
-    def display_details(self) -> None:
+    def detail_lines(self) -> List[str]:
         lecturer_name = self.lecturer.name if self.lecturer else 'TBA'
-        print(f"{self.code}: {self.title}, Credits: {self.credit_hours}, Lecturer: {lecturer_name}")
-        print("Enrolled students:")
-        for s in self.students:
-            print(f"- {s.name}")
+        lines = [f"{self.code}: {self.title}, Credits: {self.credit_hours}, Lecturer: {lecturer_name}",
+                 "Enrolled students:"]
+        lines.extend(f"- {s.name}" for s in self.students)
+        return lines
+
+    def display_details(self) -> None:
+        print("\n".join(self.detail_lines()))
+
+
+def _link(student: Student, course: Course) -> bool:
+    """
+    Single enrollment path: one membership test, then both sides' list and index are updated.
+    Returns True if the link was created, False if the student was already enrolled.
+    """
+    if student.person_id in course._student_ids:
+        return False
+    course._student_ids.add(student.person_id)
+    course.students.append(student)
+    student._code_to_course[course.code] = course
+    student.courses.append(course)
+    return True
+
+
+def _unlink(student: Student, course: Course) -> bool:
+    """
+    Inverse of _link: removes the enrollment from both sides, including the cached lookups
+    and the student's grade and attendance for the course.
+    Like _link, students are matched by person_id and courses by code, so the enrolled
+    objects are located by key before anything is changed.
+    Returns True if the link was removed, False if the student was not enrolled.
+    """
+    sid = student.person_id
+    code = course.code
+    if sid not in course._student_ids:
+        return False
+    i = next(i for i, s in enumerate(course.students) if s.person_id == sid)
+    enrolled = course.students[i]
+    j = next(j for j, c in enumerate(enrolled.courses) if c.code == code)
+    course._student_ids.discard(sid)
+    del course.students[i]
+    del enrolled.courses[j]
+    enrolled._code_to_course.pop(code, None)
+    enrolled.grades.pop(code, None)
+    enrolled.attendance.pop(code, None)
+    return True
 
 
 class Lecturer(Person):
+    __slots__ = ("department", "courses", "_course_codes")
+
     def __init__(self, staff_id: str, name: str, email: str, department: str):
         super().__init__(staff_id, name, email)
         self.role = "Lecturer"
         self.department = department
         self.courses: List[Course] = []
+        self._course_codes: Set[str] = set()       # mirrors self.courses for O(1) membership
 
     def assign_course(self, course: Course) -> bool:
-        if any(c.code == course.code for c in self.courses):
+        if course.code in self._course_codes:
             return False
+        self._course_codes.add(course.code)
         self.courses.append(course)
         course.lecturer = self
-        print(f"{self.name} assigned to {course.title}")
+        log.info("%s assigned to %s", self.name, course.title)
         return True
 
-    def submit_grades(self, course: Course, grade: str) -> None:
+    def submit_grades(self, course: Course, grade: str, verbose: bool = False) -> None:
         """
         Assign the same grade to every student currently enrolled in the course.
+        The grade is normalized to an interned upper-case string once here rather than on
+        every GPA computation. Raises ValueError for grades outside A-F.
+        Logs a single summary line; pass verbose=True for one line per student.
         """
+        grade = sys.intern(grade.upper())
+        if grade not in _POINTS_MAP:
+            raise ValueError(f"invalid grade {grade!r}; expected one of {', '.join(_POINTS_MAP)}")
+        code = course.code
         for s in course.students:
-            s.grades[course.code] = grade
-            print(f"Assigned grade {grade} to {s.name} for {course.code}")
+            s.grades[code] = grade
+            if verbose:
+                log.info("Assigned grade %s to %s for %s", grade, s.name, code)
+        log.info("Assigned grade %s to %d students for %s", grade, len(course.students), code)
+
+    def summary_lines(self) -> List[str]:
+        lines = [f"Lecturer: {self.name}"]
+        lines.extend(f"Teaching: {c.title} ({len(c.students)} students)" for c in self.courses)
+        return lines
 
     def print_summary(self) -> None:
-        print(f"Lecturer: {self.name}")
-        for c in self.courses:
-            print(f"Teaching: {c.title} ({len(c.students)} students)")
+        print("\n".join(self.summary_lines()))
+
+
+# Report method name per entity type, used by Registrar.full_report to walk all entities in one loop.
+_FORMATTERS: Dict[type, str] = {
+    Course: "detail_lines",
+    Lecturer: "summary_lines",
+    Student: "performance_lines",
+}
+
+# Concrete class -> that class's own report function, filled in once per type by _formatter_for.
+_RESOLVED_FORMATTERS: Dict[type, Callable[[Any], List[str]]] = {}
+
+
+def _formatter_for(cls: type) -> Callable[[Any], List[str]]:
+    """
+    Resolve the report function for cls by walking its MRO, so subclasses use their base's entry
+    (and their own override of it). The result is memoized per class.
+    """
+    for base in cls.__mro__:
+        name = _FORMATTERS.get(base)
+        if name is not None:
+            formatter = _RESOLVED_FORMATTERS[cls] = getattr(cls, name)
+            return formatter
+    raise TypeError(f"no report formatter for {cls.__name__}")
 
 
 class Registrar:
     def __init__(self):
-        self.students: List[Student] = []
-        self.courses: List[Course] = []
-        self.lecturers: List[Lecturer] = []
+        # Keyed by ID so duplicate checks and lookups are O(1) dict probes.
+        self.students: Dict[str, Student] = {}
+        self.courses: Dict[str, Course] = {}
+        self.lecturers: Dict[str, Lecturer] = {}
 
     def add_student(self, s: Student) -> bool:
-        if any(st.person_id == s.person_id for st in self.students):
-            print(f"Student {s.name} already registered.")
+        if s.person_id in self.students:
+            log.warning("Student %s already registered.", s.name)
             return False
-        self.students.append(s)
-        print(f"Added student {s.name}")
+        self.students[s.person_id] = s
+        log.info("Added student %s", s.name)
         return True
 
     def add_course(self, c: Course) -> bool:
-        if any(course.code == c.code for course in self.courses):
-            print(f"Course {c.code} already exists.")
+        if c.code in self.courses:
+            log.warning("Course %s already exists.", c.code)
             return False
-        self.courses.append(c)
+        self.courses[c.code] = c
         return True
 
     def add_lecturer(self, l: Lecturer) -> bool:
-        if any(lec.person_id == l.person_id for lec in self.lecturers):
-            print(f"Lecturer {l.name} already registered.")
+        if l.person_id in self.lecturers:
+            log.warning("Lecturer %s already registered.", l.name)
             return False
-        self.lecturers.append(l)
+        self.lecturers[l.person_id] = l
         return True
 
     def enroll(self, student_id: str, course_code: str) -> bool:
-        s = next((st for st in self.students if st.person_id == student_id), None)
-        c = next((co for co in self.courses if co.code == course_code), None)
+        s = self.students.get(student_id)
+        c = self.courses.get(course_code)
         if not s or not c:
-            print("Student or course not found.")
+            log.warning("Student or course not found.")
             return False
         return c.enroll_student(s)
 
+    @staticmethod
+    def _bulk_merge(target: Dict[str, Any], keys: List[str], batch: List[Any], kind: str) -> None:
+        """
+        Merge batch (keyed by keys) into target in one update, raising KeyError (and adding
+        nothing) on any duplicate ID, whether within the batch or against already registered entries.
+        """
+        new = dict(zip(keys, batch))
+        if len(new) != len(batch):
+            repeated = sorted(k for k, n in Counter(keys).items() if n > 1)
+            raise KeyError(f"duplicate {kind} IDs within batch: {', '.join(repeated)}")
+        dupes = new.keys() & target.keys()
+        if dupes:
+            raise KeyError(f"{kind} already registered: {', '.join(sorted(dupes))}")
+        target.update(new)
+
+    def bulk_add_students(self, students: Iterable[Student]) -> int:
+        batch = list(students)
+        self._bulk_merge(self.students, [s.person_id for s in batch], batch, "student")
+        log.info("Added %d students", len(batch))
+        return len(batch)
+
+    def bulk_add_courses(self, courses: Iterable[Course]) -> int:
+        batch = list(courses)
+        self._bulk_merge(self.courses, [c.code for c in batch], batch, "course")
+        return len(batch)
+
+    def bulk_add_lecturers(self, lecturers: Iterable[Lecturer]) -> int:
+        batch = list(lecturers)
+        self._bulk_merge(self.lecturers, [l.person_id for l in batch], batch, "lecturer")
+        return len(batch)
+
+    def bulk_enroll(self, pairs: Iterable[Tuple[str, str]]) -> int:
+        """
+        Enroll many (student_id, course_code) pairs in one pass.
+        All IDs are resolved before anything is linked; raises KeyError if any is unknown.
+        Returns the number of new enrollments (pairs already enrolled are skipped).
+        """
+        students = self.students
+        courses = self.courses
+        resolved = []
+        for sid, code in pairs:
+            s = students.get(sid)
+            if s is None:
+                raise KeyError(f"student {sid} not found")
+            c = courses.get(code)
+            if c is None:
+                raise KeyError(f"course {code} not found")
+            resolved.append((s, c))
+        enrolled = sum(_link(s, c) for s, c in resolved)
+        log.info("Enrolled %d students", enrolled)
+        return enrolled
+
     def full_report(self) -> None:
-        print("=== Full University Report ===")
-        for c in self.courses:
-            c.display_details()
-        for l in self.lecturers:
-            l.print_summary()
-        for s in self.students:
-            s.report_performance()
+        """
+        Build the whole report in memory and emit it with a single write.
+        """
+        out: List[str] = ["=== Full University Report ==="]
+        items = chain(self.courses.values(), self.lecturers.values(), self.students.values())
+        resolved = _RESOLVED_FORMATTERS
+        for item in items:
+            cls = type(item)
+            formatter = resolved.get(cls) or _formatter_for(cls)
+            out.extend(formatter(item))
+        sys.stdout.write("\n".join(out) + "\n")
 
 
 def main():
@@ -268,24 +435,24 @@ def main():
 
     s1 = Student("S001", "Alice", "alice@uni.com")
     s2 = Student("S002", "Bob", "bob@uni.com")
-    reg.add_student(s1)
-    reg.add_student(s2)
+    reg.bulk_add_students([s1, s2])
 
     l1.assign_course(c1)
-    reg.add_course(c1)
-    reg.add_course(c2)
+    reg.bulk_add_courses([c1, c2])
 
-    # use registrar.enroll to keep both sides consistent
-    reg.enroll("S001", "CS101")
-    reg.enroll("S002", "CS101")
+    # bulk_enroll links both sides, like registrar.enroll, for a whole batch
+    reg.bulk_enroll([("S001", "CS101"), ("S002", "CS101")])
 
     # Lecturer submits grades for the course he teaches
     l1.submit_grades(c1, "A")
 
-    s1.attendance["CS101"] = [True, True, False, True]
-    s2.attendance["CS101"] = [True, False, True, False]
+    for present in (True, True, False, True):
+        s1.mark_attendance("CS101", present)
+    for present in (True, False, True, False):
+        s2.mark_attendance("CS101", present)
 
     reg.full_report()
 
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
     main()